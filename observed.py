@@ -71,6 +71,7 @@ works, I recommend starting with ObservableFunction, and then ObserverFunction
 and ObserverBoundMethod.
 """
 
+import types
 import weakref
 import functools
 
@@ -79,14 +80,60 @@ __version__ = "0.5.3"
 
 INSTANCE_OBSERVER_ATTR = "_observed__observers"
 
+# What the observers attribute of an observable which has never had an
+# observer reads as. Observer storage is only allocated by the first add.
+_NO_OBSERVERS = types.MappingProxyType({})
 
-class ObserverFunction:
+
+class Observer:
+    """Base class for the wrappers of registered observers.
+
+    Subclasses implement call_identified, which calls the wrapped observer
+    with the observed object as first argument, and call_unidentified, which
+    calls it without. ObserverCollection.refresh picks one of the two for each
+    observer when it rebuilds its snapshot, so that calling the observers
+    doesn't involve checking identify_observed every time.
+
+    Attributes:
+        identify_observed: Whether the observed object is passed to the
+            wrapped observer as its first argument.
+        key: The key under which I'm stored in my ObserverCollection.
+    """
+
+    __slots__ = ('identify_observed', 'key')
+
+    def __call__(self, observed_obj, *arg, **kw):
+        """Call the observer I wrap.
+
+        Observables don't use this; they call the methods in their
+        collection's snapshot. It is kept so that an observer looked up in a
+        collection can still be called as observers[key](observed_obj, ...),
+        as when observers were stored in a dict.
+
+        Args:
+            *arg: The arguments passed to me by the observed object.
+            **kw: The keyword args passed to me by the observed object.
+            observed_obj: The observed object which called me.
+
+        Returns:
+            Whatever the observer I wrap returns.
+        """
+
+        if self.identify_observed:
+            return self.call_identified(observed_obj, *arg, **kw)
+        else:
+            return self.call_unidentified(*arg, **kw)
+
+
+class ObserverFunction(Observer):
     """Wraps a function which is registered as an observer.
 
     I use a weak reference to the observing function so that being an observer
     does not prevent garbage collection of the observing function.
     """
 
+    __slots__ = ('func_wr',)
+
     def __init__(self, func, identify_observed, weakref_info):
         """Initialize an ObserverFunction.
 
@@ -96,85 +143,295 @@ class ObserverFunction:
                 the observed object as the first argument to the function I
                 wrap. True means pass the observed object, False means do not
                 pass the observed objec.
-            weakref_info: Tuple of (key, dict) where dict is the dictionary
-                which is keeping track of my role as an observer and key is
-                the key in that dict which maps to me. When the function I wrap
-                is finalized, I use this information to delete myself from the
-                dictionary.
+            weakref_info: Tuple of (key, observers) where observers is the
+                ObserverCollection which is keeping track of my role as an
+                observer and key is the key in that collection which maps to
+                me. When the function I wrap is finalized, I use this
+                information to queue my key in the collection's dead list, so
+                that the collection removes me. See ObserverCollection.purge.
         """
 
-        # For some reason, if we put the update_wrapper after we make the
-        # weak reference to func, the call to weakref.ref returns a function
-        # instead of a weak ref. So, don't move the next line chomp, chomp...
-        functools.update_wrapper(self, func)
         self.identify_observed = identify_observed
-        key, d = weakref_info
-        self.func_wr = weakref.ref(func, CleanupHandler(key, d))
+        key, observers = weakref_info
+        self.key = key
+        self.func_wr = weakref.ref(
+            func, DeferredCleanupHandler(key, observers.dead))
 
-    def __call__(self, observed_obj, *arg, **kw):
-        """Call the function I wrap.
+    def call_identified(self, observed_obj, *arg, **kw):
+        """Call the function I wrap, passing it the observed object."""
 
-        Args:
-            *arg: The arguments passed to me by the observed object.
-            **kw: The keyword args passed to me by the observed object.
-            observed_obj: The observed object which called me.
+        func = self.func_wr()
+        if func is None:
+            # The function was finalized and my removal is still pending.
+            return None
+        return func(observed_obj, *arg, **kw)
 
-        Returns:
-            Whatever the function I wrap returns.
-        """
+    def call_unidentified(self, *arg, **kw):
+        """Call the function I wrap without the observed object."""
 
-        if self.identify_observed:
-            return self.func_wr()(observed_obj, *arg, **kw)
-        else:
-            return self.func_wr()(*arg, **kw)
+        func = self.func_wr()
+        if func is None:
+            # The function was finalized and my removal is still pending.
+            return None
+        return func(*arg, **kw)
 
 
-class ObserverBoundMethod:
+class ObserverBoundMethod(Observer):
     """I wrap a bound method which is registered as an observer.
 
     I use a weak reference to the observing bound method's instance so that
     being an observer does not prevent garbage collection of that instance.
+
+    I hold the function underlying the bound method, which is looked up once
+    when I'm created, and call it with the instance. This way calling me
+    doesn't have to look up the method on the instance every time.
     """
 
-    def __init__(self, inst, method_name, identify_observed, weakref_info):
+    __slots__ = ('inst', 'func')
+
+    def __init__(self, inst, func, identify_observed, weakref_info):
         """Initialize an ObserverBoundMethod.
 
         Args:
             inst: the object to which the bound method I wrap is bound.
-            method_name: the name of the method I wrap.
+            func: the function underlying the bound method I wrap, i.e. a
+                callable such that func(inst, *arg, **kw) calls the bound
+                method.
             identify_observed: boolean indicating whether or not I will pass
                 the observed object as the first argument to the function I
                 wrap. True means pass the observed object, False means do not
                 pass the observed objec.
-            weakref_info: Tuple of (key, dict) where dict is the dictionary
-                which is keeping track of my role as an observer and key is
-                the key in that dict which maps to me. When the function I wrap
-                is finalized, I use this information to delete myself from the
-                dictionary.
+            weakref_info: Tuple of (key, observers) where observers is the
+                ObserverCollection which is keeping track of my role as an
+                observer and key is the key in that collection which maps to
+                me. When inst is finalized, I use this information to queue
+                my key in the collection's dead list, so that the collection
+                removes me. See ObserverCollection.purge.
         """
 
         self.identify_observed = identify_observed
-        key, d = weakref_info
-        self.inst = weakref.ref(inst, CleanupHandler(key, d))
-        self.method_name = method_name
+        key, observers = weakref_info
+        self.key = key
+        self.inst = weakref.ref(
+            inst, DeferredCleanupHandler(key, observers.dead))
+        self.func = func
     
-    def __call__(self, observed_obj, *arg, **kw):
-        """Call the function I wrap.
+    def call_identified(self, observed_obj, *arg, **kw):
+        """Call the bound method I wrap, passing it the observed object."""
+
+        inst = self.inst()
+        if inst is None:
+            # The instance was finalized and my removal is still pending.
+            return None
+        return self.func(inst, observed_obj, *arg, **kw)
+
+    def call_unidentified(self, *arg, **kw):
+        """Call the bound method I wrap without the observed object."""
+
+        inst = self.inst()
+        if inst is None:
+            # The instance was finalized and my removal is still pending.
+            return None
+        return self.func(inst, *arg, **kw)
+
+
+class ObserverBuiltinMethod(Observer):
+    """I wrap a built in method which is registered as an observer.
+
+    Built in methods and functions, e.g. set().add, print or dict.fromkeys,
+    have a __self__ but no __func__, and their __self__ may be a module or a
+    type rather than an instance holding the method. So instead of holding
+    the underlying function like ObserverBoundMethod, I look the method up by
+    name on __self__ each time I'm called.
+
+    I use a weak reference to __self__ so that being an observer does not
+    prevent garbage collection of it.
+    """
+
+    __slots__ = ('inst', 'method_name')
+
+    def __init__(self, inst, method_name, identify_observed, weakref_info):
+        """Initialize an ObserverBuiltinMethod.
 
         Args:
-            *arg: The arguments passed to me by the observed object.
-            **kw: The keyword args passed to me by the observed object.
-            observed_obj: The observed object which called me.
+            inst: the __self__ of the built in method I wrap.
+            method_name: the name of the built in method I wrap.
+            identify_observed: boolean indicating whether or not I will pass
+                the observed object as the first argument to the method I
+                wrap. True means pass the observed object, False means do not
+                pass the observed object.
+            weakref_info: Tuple of (key, observers) where observers is the
+                ObserverCollection which is keeping track of my role as an
+                observer and key is the key in that collection which maps to
+                me. When inst is finalized, I use this information to queue
+                my key in the collection's dead list, so that the collection
+                removes me. See ObserverCollection.purge.
+        """
+
+        self.identify_observed = identify_observed
+        key, observers = weakref_info
+        self.key = key
+        self.inst = weakref.ref(
+            inst, DeferredCleanupHandler(key, observers.dead))
+        self.method_name = method_name
+
+    def call_identified(self, observed_obj, *arg, **kw):
+        """Call the method I wrap, passing it the observed object."""
+
+        inst = self.inst()
+        if inst is None:
+            # The instance was finalized and my removal is still pending.
+            return None
+        return getattr(inst, self.method_name)(observed_obj, *arg, **kw)
+
+    def call_unidentified(self, *arg, **kw):
+        """Call the method I wrap without the observed object."""
+
+        inst = self.inst()
+        if inst is None:
+            # The instance was finalized and my removal is still pending.
+            return None
+        return getattr(inst, self.method_name)(*arg, **kw)
+
+
+class ObserverCollection:
+    """The observers registered to one observable function or bound method.
+
+    I keep the observers in a flat list. Alongside the list I keep an index
+    from each observer's key to its position in the list, so that removing an
+    observer doesn't require searching for it. An observer is removed by
+    moving the last observer in the list into its slot, so the order in which
+    observers are called is not the order in which they were added.
+
+    Observables don't loop over the list itself but over snapshot, which is
+    made from the list when it's first needed after the list changes. The
+    snapshot is a pair of tuples (unidentified, identified). unidentified
+    holds the call_unidentified methods of the observers which don't want the
+    observed object, and identified holds the call_identified methods of
+    those which do. An observable calls each of the first with its own
+    arguments, and each of the second with itself followed by its arguments,
+    so neither loop has to check identify_observed. Adding or removing
+    observers while the observers are being called doesn't disturb those
+    loops, and takes effect the next time the observable is called. Use
+    refresh to get an up to date snapshot.
+
+    I support the reading parts of the dict interface (in, [], len, iteration
+    and keys) as well as del, with the same meaning as for a dict mapping
+    observer keys to observers. Observers are added with add.
+
+    Observers whose function or instance is garbage collected are not removed
+    straight away by the weak reference callback, which may run while someone
+    is iterating over callables. Instead the callback appends the observer's
+    key to dead, and the observer is removed the next time purge is called.
+
+    Attributes:
+        callables: List of my observers.
+        index: Dict mapping each observer key to the position of that observer
+            in callables.
+        dead: List of keys of observers which are waiting to be purged.
+        snapshot: Pair of tuples of methods of my observers (see above), or
+            None if callables has changed since the snapshot was made.
+    """
+
+    __slots__ = ('callables', 'index', 'dead', 'snapshot')
+
+    def __init__(self):
+        """Initialize an empty ObserverCollection."""
+
+        self.callables = []
+        self.index = {}
+        self.dead = []
+        self.snapshot = ((), ())
+
+    # The dict style accessors purge first, so that an observer whose
+    # function or instance is gone isn't visible, and a stale key can't match
+    # a new object which was given the same id.
+
+    def __contains__(self, key):
+        if self.dead:
+            self.purge()
+        return key in self.index
+
+    def __len__(self):
+        if self.dead:
+            self.purge()
+        return len(self.callables)
+
+    def __iter__(self):
+        if self.dead:
+            self.purge()
+        return iter(self.index)
+
+    def keys(self):
+        """Return a view of the keys of my observers."""
+
+        if self.dead:
+            self.purge()
+        return self.index.keys()
+
+    def __getitem__(self, key):
+        if self.dead:
+            self.purge()
+        return self.callables[self.index[key]]
+
+    def add(self, observer):
+        """Add an observer whose key isn't in me yet."""
+
+        self.snapshot = None
+        self.index[observer.key] = len(self.callables)
+        self.callables.append(observer)
+
+    def __delitem__(self, key):
+        if not self.discard(key):
+            raise KeyError(key)
+
+    def discard(self, key):
+        """Remove the observer under key, if there is one.
+
+        The last observer in the list is moved into the removed observer's
+        position so that nothing else has to be shifted.
 
         Returns:
-            Whatever the function I wrap returns.
+            True if an observer was removed, otherwise False.
         """
 
-        bound_method = getattr(self.inst(), self.method_name)
-        if self.identify_observed:
-            return bound_method(observed_obj, *arg, **kw)
-        else:
-            return bound_method(*arg, **kw)
+        position = self.index.pop(key, None)
+        if position is None:
+            return False
+        self.snapshot = None
+        last = self.callables.pop()
+        if position < len(self.callables):
+            self.callables[position] = last
+            self.index[last.key] = position
+        return True
+
+    def purge(self):
+        """Remove the observers whose keys are waiting in dead."""
+
+        # The list is emptied in place, because the weak reference callbacks
+        # of my observers hold on to it. Popping from the end is cheap, and
+        # keys appended while purging are picked up by the loop.
+        dead = self.dead
+        discard = self.discard
+        while dead:
+            discard(dead.pop())
+
+    def refresh(self):
+        """Purge dead observers and return an up to date snapshot."""
+
+        if self.dead:
+            self.purge()
+        snapshot = self.snapshot
+        if snapshot is None:
+            unidentified = tuple(observer.call_unidentified
+                                 for observer in self.callables
+                                 if not observer.identify_observed)
+            identified = tuple(observer.call_identified
+                               for observer in self.callables
+                               if observer.identify_observed)
+            snapshot = (unidentified, identified)
+            self.snapshot = snapshot
+        return snapshot
 
 
 class ObservableFunction:
@@ -189,18 +446,26 @@ class ObservableFunction:
     add_observer(observer)
         registers observer to be called whenever I am called
 
+    add_observers(observers)
+        registers each of several observers, as add_observer does
+
     discard_observer(observer)
         Removes an observer from the set of observers.
 
     Attributes:
         func: The function I wrap.
-        observers: Dict mapping keys unique to each observer to that observer.
-            If this sounds like a job better served by a set, you're probably
-            right and making that change is planned. It's delicate because it
-            requires making sure the observer objects are hashable and have a
-            proper notion of equality.
+        observers: ObserverCollection holding my observers, each stored under
+            a key unique to that observer. See make_key. Until the first
+            observer is added this is an empty read-only mapping, so that
+            functions which are never observed don't carry an empty collection
+            around.
     """
 
+    # __dict__ is kept so that functools.update_wrapper can copy the wrapped
+    # function's metadata onto me, and __weakref__ so that I can myself be
+    # registered as an observer.
+    __slots__ = ('func', '_observers', '__dict__', '__weakref__')
+
     def __init__(self, func):
         """Initialize an ObservableFunction.
 
@@ -210,7 +475,33 @@ class ObservableFunction:
 
         functools.update_wrapper(self, func)
         self.func = func
-        self.observers = {}  # observer key -> observer
+        self._observers = None
+
+    @property
+    def observers(self):
+        """ObserverCollection holding my observers. See the class docstring."""
+
+        observers = self._get_observers()
+        if observers is None:
+            return _NO_OBSERVERS
+        return observers
+
+    def _get_observers(self, create=False):
+        """Get the ObserverCollection holding my observers.
+
+        Args:
+            create: If True, create the collection if it doesn't exist yet.
+
+        Returns:
+            My ObserverCollection, or None if I have never had an observer and
+            create is False.
+        """
+
+        observers = self._observers
+        if observers is None and create:
+            observers = ObserverCollection()
+            self._observers = observers
+        return observers
 
     def add_observer(self, observer, identify_observed=False):
         """Register an observer to observe me.
@@ -228,6 +519,12 @@ class ObservableFunction:
         The observing function or method will be called whenever I am called,
         and with the same arguments and keyword arguments.
 
+        A bound method observer calls the function it was bound to when it
+        was registered. If the method is later replaced on its instance, e.g.
+        by assigning inst.method = other, the observer still calls the
+        original. Built in methods and functions, which have no __func__, are
+        looked up by name on their __self__ each time they are called.
+
         If a bound method or function has already been registered as an
         observer, trying to add it again does nothing. In other words, there is
         no way to sign up an observer to be called back multiple times. This
@@ -235,18 +532,56 @@ class ObservableFunction:
         if there is a compelling use case where this is inconvenient.
         """
 
+        observers = self._get_observers(create=True)
+        observers.purge()
+        return self._add(observers, observer, identify_observed)
+
+    def add_observers(self, observers, identify_observed=False):
+        """Register several observers to observe me.
+
+        Args:
+            observers: Iterable of callables to register as observers.
+            identify_observed: See docstring for add_observer. Applies to
+                every observer in observers.
+
+        Returns:
+            The number of observers which were added. Observers which were
+            already registered are not counted.
+        """
+
+        collection = self._get_observers(create=True)
+        collection.purge()
+        add = self._add
+        added = 0
+        for observer in observers:
+            added += add(collection, observer, identify_observed)
+        return added
+
+    def _add(self, observers, observer, identify_observed):
+        """Add a function or bound method as an observer.
+
+        Args:
+            observers: My ObserverCollection.
+            observer: The callable to register as an observer.
+            identify_observed: See docstring for add_observer.
+
+        Returns:
+            True if the observer is added, otherwise False.
+        """
+
         # If the observer is a bound method,
         if hasattr(observer, "__self__"):
-            result = self._add_bound_method(observer, identify_observed)
+            return self._add_bound_method(
+                observers, observer, identify_observed)
         # Otherwise, assume observer is a normal function.
         else:
-            result = self._add_function(observer, identify_observed)
-        return result
+            return self._add_function(observers, observer, identify_observed)
 
-    def _add_function(self, func, identify_observed):
+    def _add_function(self, observers, func, identify_observed):
         """Add a function as an observer.
 
         Args:
+            observers: My ObserverCollection.
             func: The function to register as an observer.
             identify_observed: See docstring for add_observer.
 
@@ -255,17 +590,18 @@ class ObservableFunction:
         """
 
         key = self.make_key(func)
-        if key not in self.observers:
-            self.observers[key] = ObserverFunction(
-                func, identify_observed, (key, self.observers))
+        if key not in observers:
+            observers.add(ObserverFunction(
+                func, identify_observed, (key, observers)))
             return True
         else:
             return False
 
-    def _add_bound_method(self, bound_method, identify_observed):
+    def _add_bound_method(self, observers, bound_method, identify_observed):
         """Add an bound method as an observer.
 
         Args:
+            observers: My ObserverCollection.
             bound_method: The bound method to add as an observer.
             identify_observed: See the docstring for add_observer.
 
@@ -274,11 +610,19 @@ class ObservableFunction:
         """
 
         inst = bound_method.__self__
-        method_name = bound_method.__name__
         key = self.make_key(bound_method)
-        if key not in self.observers:
-            self.observers[key] = ObserverBoundMethod(
-                inst, method_name, identify_observed, (key, self.observers))
+        if key not in observers:
+            try:
+                func = bound_method.__func__
+            except AttributeError:
+                # Built in methods don't have __func__.
+                observer = ObserverBuiltinMethod(
+                    inst, bound_method.__name__, identify_observed,
+                    (key, observers))
+            else:
+                observer = ObserverBoundMethod(
+                    inst, func, identify_observed, (key, observers))
+            observers.add(observer)
             return True
         else:
             return False
@@ -291,12 +635,11 @@ class ObservableFunction:
 
         Returns true if an observer was removed, otherwise False.
         """
-        discarded = False
-        key = self.make_key(observer)
-        if key in self.observers:
-            del self.observers[key]
-            discarded = True
-        return discarded
+        observers = self._get_observers()
+        if observers is None:
+            return False
+        observers.purge()
+        return observers.discard(self.make_key(observer))
 
     @staticmethod
     def make_key(observer):
@@ -324,40 +667,129 @@ class ObservableFunction:
             Whatever the wrapped callable returns.
 
         Note:
-        I think it is possible for observers to disappear while we execute
-        them. It might be better to make strong references to all
-        observers before we start callback execution, since we don't keep
-        strong references elsewhere.
-        """
-        result = self.func(*arg, **kw)
-        for key in self.observers:
-            self.observers[key](self, *arg, **kw)
+        An observer which is garbage collected while I am calling my observers
+        is skipped. It is removed from my collection the next time I'm called.
+        Observers added or discarded while I am calling my observers are
+        called, or not, starting from my next call.
+        """
+        observers = self._observers
+        func = self.func
+        if observers is None or not observers.callables:
+            # Nobody is observing me.
+            return func(*arg, **kw)
+        result = func(*arg, **kw)
+        self._notify_observers(observers, arg, kw)
         return result
 
+    def _notify_observers(self, observers, arg, kw):
+        """Call my observers.
+
+        Args:
+            observers: My ObserverCollection.
+            arg: Tuple of the positional arguments I was called with.
+            kw: Dict of the keyword arguments I was called with.
+        """
+
+        snapshot = observers.snapshot
+        if snapshot is None or observers.dead:
+            snapshot = observers.refresh()
+        unidentified, identified = snapshot
+        if arg or kw:
+            for notify in unidentified:
+                notify(*arg, **kw)
+            for notify in identified:
+                notify(self, *arg, **kw)
+        else:
+            # Calls without arguments are common, and a call with nothing to
+            # unpack is noticeably cheaper, so they get their own loops.
+            for notify in unidentified:
+                notify()
+            for notify in identified:
+                notify(self)
+
+
+class _FunctionAttribute(str):
+    """A class attribute of ObservableBoundMethod read from the function.
+
+    Every class has its own __doc__ and __module__, so __getattr__ never sees
+    them. I replace them in the class body. Read from an instance, I return
+    the attribute of the same name of the instance's func. Read from the
+    class, I return the class's own value; being a str, I also work where
+    Python reads __module__ from the class without calling descriptors.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, inst, cls=None):
+        if inst is None:
+            return str(self)
+        return getattr(inst.func, self.name)
+
 
 class ObservableBoundMethod(ObservableFunction):
     """I wrap a bound method and allow observers to be registered."""
 
-    def __init__(self, func, inst, observers):
+    __slots__ = ('inst', '_manager')
+
+    __doc__ = _FunctionAttribute(__doc__)
+    __module__ = _FunctionAttribute(__module__)
+
+    def __init__(self, manager, inst):
         """Initialize an ObservableBoundMethod.
 
         Args:
-            func: The function (i.e. unbound method) I wrap.
-            inst: The instance to which I am bound.
-            observers: Dict mapping keys unique to each observer to that
-                observer. This dict comes from the descriptor which generates
-                this ObservableBoundMethod instance. In this way, multiple
+            manager: The descriptor which generated me. It stores the
+                observers of the bound method I wrap. In this way, multiple
                 instances of ObservableBoundMethod with the same underlying
                 object instance and method all add, remove, and call observers
-                from the same collection.
-                If you think this dict should probably be a set instead then
-                you probably grok this module.
+                from the same collection. See ObservableMethodManager_*.
+            inst: The instance to which I am bound.
         """
 
-        self.func = func
-        functools.update_wrapper(self, func)
+        # I am created every time the observable method is accessed, so
+        # rather than copying the wrapped function's metadata onto myself with
+        # functools.update_wrapper, I look it up on the function when asked.
+        # See __name__, __wrapped__, __getattr__ and _FunctionAttribute.
+        self.func = manager._func
         self.inst = inst
-        self.observers = observers
+        self._manager = manager
+
+    @property
+    def __name__(self):
+        """The name of the method I wrap."""
+
+        return self.func.__name__
+
+    @property
+    def __wrapped__(self):
+        """The function I wrap."""
+
+        return self.func
+
+    def __getattr__(self, name):
+        """Get attributes I don't have, e.g. __qualname__, from func.
+
+        Only the attributes which functools.update_wrapper would have copied
+        from func are forwarded: those in functools.WRAPPER_ASSIGNMENTS, and
+        those in func's __dict__.
+        """
+
+        if name != 'func':
+            # Don't recurse if I haven't been initialized.
+            func = self.func
+            if name in functools.WRAPPER_ASSIGNMENTS or name in func.__dict__:
+                return getattr(func, name)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _get_observers(self, create=False):
+        """Get the ObserverCollection holding my observers.
+
+        The collection is owned by my manager, so that it outlives me.
+        """
+
+        return self._manager.get_observers(self.inst, create)
 
     def __call__(self, *arg, **kw):
         """Invoke the bound method I wrap, and all of my observers.
@@ -373,15 +805,20 @@ class ObservableBoundMethod(ObservableFunction):
             Whatever the wrapped bound method returns.
 
         Note:
-        I think it is possible for observers to disappear while we execute
-        them. It might be better to make strong references to all
-        observers before we start callback execution, since we don't keep
-        strong references elsewhere.
+        An observer which is garbage collected while I am calling my observers
+        is skipped. It is removed from my collection the next time I'm called.
+        Observers added or discarded while I am calling my observers are
+        called, or not, starting from my next call.
         """
 
-        result = self.func(self.inst, *arg, **kw)
-        for key in self.observers:
-            self.observers[key](self, *arg, **kw)
+        inst = self.inst
+        func = self.func
+        observers = self._manager.get_observers(inst)
+        if observers is None or not observers.callables:
+            # Nobody is observing me.
+            return func(inst, *arg, **kw)
+        result = func(inst, *arg, **kw)
+        self._notify_observers(observers, arg, kw)
         return result
 
     def __eq__(self, other):
@@ -397,6 +834,16 @@ class ObservableBoundMethod(ObservableFunction):
 
         return self.inst
 
+    @property
+    def __func__(self):
+        """The unbound version of me.
+
+        Calling it with my instance as the first argument is the same as
+        calling me.
+        """
+
+        return self._manager._unbound_method
+
 
 """
 The following two classes are descriptors which manage access to observable
@@ -431,6 +878,8 @@ class ObservableMethodManager_PersistOnInstances:
     instance and return it.
     """
 
+    __slots__ = ('_func', '_unbound_method')
+
     def __init__(self, func):
         """Initialize an ObservableMethodManager_PersistOnInstances.
 
@@ -456,14 +905,35 @@ class ObservableMethodManager_PersistOnInstances:
 
         if inst is None:
             return self._unbound_method
-        else:
-            if not hasattr(inst, INSTANCE_OBSERVER_ATTR):
-                d = {}
-                setattr(inst, INSTANCE_OBSERVER_ATTR, d)
-            else:
-                d = getattr(inst, INSTANCE_OBSERVER_ATTR)
-            observers = d.setdefault(self._func.__name__, {})
-        return ObservableBoundMethod(self._func, inst, observers)
+        return ObservableBoundMethod(self, inst)
+
+    def get_observers(self, inst, create=False):
+        """Get the observers of my method bound to an instance.
+
+        The observers are stored in an attribute of the instance. That
+        attribute, and the collection for my method within it, are only created
+        when the first observer is added.
+
+        Args:
+            inst: The instance whose observers we want.
+            create: If True, create the collection if it doesn't exist yet.
+
+        Returns:
+            An ObserverCollection, or None if no observer was ever added to my
+            method on inst and create is False.
+        """
+
+        d = getattr(inst, INSTANCE_OBSERVER_ATTR, None)
+        if d is None:
+            if not create:
+                return None
+            d = {}
+            setattr(inst, INSTANCE_OBSERVER_ATTR, d)
+        observers = d.get(self._func.__name__)
+        if observers is None and create:
+            observers = ObserverCollection()
+            d[self._func.__name__] = observers
+        return observers
 
     def __set__(self, inst, val):
         """Disallow setting because we don't guarantee behavior."""
@@ -500,6 +970,8 @@ class ObservableMethodManager_PersistOnDescriptor:
     # instances themselves, which is done by
     #   ObservableMethodManager_PersistOnInstances.
 
+    __slots__ = ('_func', '_unbound_method', 'instances')
+
     def __init__(self, func):
         """Initialize an ObservableMethodManager_PersistOnDescriptor.
 
@@ -520,6 +992,22 @@ class ObservableMethodManager_PersistOnDescriptor:
         """
         if inst is None:
             return self._unbound_method
+        return ObservableBoundMethod(self, inst)
+
+    def get_observers(self, inst, create=False):
+        """Get the observers of my method bound to an instance.
+
+        An instance is only tracked once the first observer is added to my
+        method on that instance.
+
+        Args:
+            inst: The instance whose observers we want.
+            create: If True, create the collection if it doesn't exist yet.
+
+        Returns:
+            An ObserverCollection, or None if no observer was ever added to my
+            method on inst and create is False.
+        """
         # Only weak references to instances are stored. This guarantees that
         # the descriptor cannot prevent the instances it manages from being
         # garbage collected.
@@ -534,11 +1022,13 @@ class ObservableMethodManager_PersistOnDescriptor:
             if wr() is None:
                 msg = "Unreachable: instance id=%d not cleaned up"%(inst_id,)
                 raise RuntimeError(msg)
-        else:
+        elif create:
             wr = weakref.ref(inst, CleanupHandler(inst_id, self.instances))
-            observers = {}
+            observers = ObserverCollection()
             self.instances[inst_id] = (wr, observers)
-        return ObservableBoundMethod(self._func, inst, observers)
+        else:
+            observers = None
+        return observers
 
     def __set__(self, inst, val):
         """Disallow setting because we don't guarantee behavior."""
@@ -565,7 +1055,7 @@ class ObservableUnboundMethod:
         the code for managing observers is invoked in the same was as it would
         be for a bound method.
         """
-        bound_method = self._manager.__get__(obj, obj.__class__)
+        bound_method = ObservableBoundMethod(self._manager, obj)
         return bound_method(*arg, **kw)
 
 
@@ -575,6 +1065,9 @@ class CleanupHandler:
     Use me as a weakref.ref callback to remove an object's id from a dict when
     that object is garbage collected.
     """
+
+    __slots__ = ('key', 'd')
+
     def __init__(self, key, d):
         """ Initialize a cleanup handler.
 
@@ -598,6 +1091,36 @@ class CleanupHandler:
             del self.d[self.key]
 
 
+class DeferredCleanupHandler:
+    """Schedule removal of an observer when the object it refers to dies.
+
+    Use me as a weakref.ref callback for the function or instance behind an
+    observer. Unlike CleanupHandler, I don't remove anything myself; I only
+    record the observer's key so that its ObserverCollection can remove it
+    later. See ObserverCollection.purge.
+    """
+
+    __slots__ = ('key', 'queue')
+
+    def __init__(self, key, queue):
+        """Initialize a deferred cleanup handler.
+
+        Args:
+            key: the key of the observer to remove.
+            queue: the list in which we record the key.
+        """
+        self.key = key
+        self.queue = queue
+
+    def __call__(self, wr):
+        """Record that the observer with my key should be removed.
+
+        Args:
+            wr: The weak reference being finalized.
+        """
+        self.queue.append(self.key)
+
+
 def observable_function(func):
     """Decorate a function to make it observable.
 